@@ -1,9 +1,37 @@
 """FastAPI dependencies for authentication and authorization."""
 
+import hashlib
+import time
+
+from cachetools import TLRUCache
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from app.utils.security import TokenError, decode_token
+from app.utils.security import TokenError, TokenPayload, decode_token
+
+# Token解析缓存TTL（秒）
+TOKEN_CACHE_TTL = 30
+
+
+def _token_ttu(_key: str, payload: TokenPayload, now: float) -> float:
+    """缓存过期时间取 TTL 与 Token 过期时间的较小值，避免返回已过期的Token。"""
+    return min(now + TOKEN_CACHE_TTL, payload.exp)
+
+
+# 以 Token 摘要为 key 缓存解析结果，不保存原始Token
+_token_cache = TLRUCache(
+    maxsize=10000, ttu=_token_ttu, timer=time.time
+)
+
+
+def _decode_token_cached(token: str) -> TokenPayload:
+    """带缓存的 decode_token，只缓存解析成功的结果。"""
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    payload = _token_cache.get(key)
+    if payload is None:
+        payload = decode_token(token)
+        _token_cache[key] = payload
+    return payload
 
 
 class JWTBearer(HTTPBearer):
@@ -19,7 +47,7 @@ class JWTBearer(HTTPBearer):
         if credentials.scheme != "Bearer":
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="认证方式错误")
         try:
-            payload = decode_token(credentials.credentials)
+            payload = _decode_token_cached(credentials.credentials)
             if payload.token_type != "access":
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token类型错误")
             return {"token": credentials.credentials, "user_id": payload.user_id}
@@ -38,7 +66,7 @@ class OptionalJWTBearer(HTTPBearer):
         if not credentials or credentials.scheme != "Bearer":
             return None
         try:
-            payload = decode_token(credentials.credentials)
+            payload = _decode_token_cached(credentials.credentials)
             if payload.token_type != "access":
                 return None
             return {"token": credentials.credentials, "user_id": payload.user_id}
@@ -1,5 +1,7 @@
 """Telegram Webhook 路由。"""
 
+import sys
+
 from fastapi import APIRouter, Path, Request
 from fastapi.responses import Response
 
@@ -13,8 +15,9 @@ router = APIRouter(prefix="/tg-bot", tags=["telegram"])
     summary="Telegram Webhook",
     description="接收 Telegram Bot 的 webhook 回调请求",
     responses={
-        200: {"description": "处理成功"},
-        404: {"description": "Bot不存在或未启用webhook模式"}
+        200: {"description": "已接收，后台处理"},
+        404: {"description": "Bot不存在或未启用webhook模式"},
+        500: {"description": "待处理更新过多，Telegram 将稍后重试"},
     },
 )
 async def webhook_handler(
@@ -22,9 +25,11 @@ async def webhook_handler(
         bot_name: str = Path(..., description="Bot名称"),
 ) -> Response:
     """处理Telegram webhook请求。"""
-    instance = bot_manager.get(bot_name)
+    instance = bot_manager.get(sys.intern(bot_name))
     if not instance or instance.is_polling:
         return Response(status_code=404)
 
-    await instance.feed_update(await request.json())
+    # 先应答 Telegram，更新在后台处理，避免慢 handler 阻塞投递
+    if not instance.submit_update(await request.body()):
+        return Response(status_code=500)
     return Response(status_code=200)
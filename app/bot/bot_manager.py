@@ -1,16 +1,28 @@
 """Bot Manager for managing multiple Telegram bots."""
 
 import asyncio
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.types import Update
 
 from app.core.config import settings
 from app.core.logger import logger
 
+# 每个Bot待处理webhook更新队列上限，超出时拒绝（由Telegram稍后重试）
+MAX_PENDING_UPDATES = 100
+# 每个Bot同时处理的更新数上限
+MAX_CONCURRENT_UPDATES = 20
+# 停止时等待已接收更新处理完成的最长时间（秒）
+UPDATE_DRAIN_TIMEOUT = 10
+
+# 所有Bot共用的默认属性（只读，可安全共享）
+_DEFAULT_BOT_PROPS = DefaultBotProperties(parse_mode=ParseMode.MARKDOWN_V2)
+
 
 class BotMode(Enum):
     """Bot运行模式。"""
@@ -31,13 +43,20 @@ class BotInstance:
     bot: Bot = field(init=False)
     dp: Dispatcher = field(init=False)
     _polling_task: asyncio.Task | None = field(init=False, default=None)
+    _update_queue: asyncio.Queue[bytes] = field(init=False)
+    _consumer_task: asyncio.Task | None = field(init=False, default=None)
+    _update_semaphore: asyncio.Semaphore = field(init=False)
+    _update_tasks: set[asyncio.Task] = field(init=False, default_factory=set)
+    dropped_updates: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
         self.bot = Bot(
             token=self.token,
-            default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN_V2),
+            default=_DEFAULT_BOT_PROPS,
         )
         self.dp = Dispatcher()
+        self._update_queue = asyncio.Queue(maxsize=MAX_PENDING_UPDATES)
+        self._update_semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPDATES)
         if not self.webhook_path:
             self.webhook_path = f"/webhook/{self.name}"
 
@@ -67,6 +86,7 @@ class BotInstance:
             raise ValueError(
                 f"Bot '{self.name}': webhook_base_url is required for webhook mode")
 
+        self._consumer_task = asyncio.create_task(self._consume_updates())
         webhook_url = f"{self.webhook_base_url}{self.webhook_path}"
         await self.bot.set_webhook(url=webhook_url, drop_pending_updates=True)
         logger.info(f"Bot '{self.name}' webhook set to {webhook_url}")
@@ -78,16 +98,68 @@ class BotInstance:
             self._polling_task.cancel()
             self._polling_task = None
 
+        if self._consumer_task:
+            # 处理完已接收的更新再退出，处理卡住时超时放弃
+            try:
+                async with asyncio.timeout(UPDATE_DRAIN_TIMEOUT):
+                    await self._update_queue.join()
+            except TimeoutError:
+                logger.warning(
+                    f"Bot '{self.name}' pending updates not finished in "
+                    f"{UPDATE_DRAIN_TIMEOUT}s, cancelling")
+            self._consumer_task.cancel()
+            self._consumer_task = None
+            for task in self._update_tasks:
+                task.cancel()
+
         await self.bot.session.close()
         logger.info(f"Bot '{self.name}' stopped")
 
-    async def feed_update(self, update_data: dict) -> None:
-        """处理webhook更新（仅webhook模式使用）。"""
-        from aiogram.types import Update
+    async def feed_update(self, raw: bytes) -> None:
+        """处理webhook更新（仅webhook模式使用）。
 
-        update = Update.model_validate(update_data)
+        直接从原始JSON字节校验，并绑定当前Bot，避免 Dispatcher 再次序列化重建 Update。
+        """
+        update = Update.model_validate_json(raw, context={"bot": self.bot})
         await self.dp.feed_update(self.bot, update)
 
+    def submit_update(self, raw: bytes) -> bool:
+        """
+        提交webhook更新到队列，由后台任务并发处理，不等待处理完成。
+
+        Returns:
+            是否已接收；队列已满时返回False
+        """
+        try:
+            self._update_queue.put_nowait(raw)
+        except asyncio.QueueFull:
+            self.dropped_updates += 1
+            logger.warning(
+                f"Bot '{self.name}' too many pending updates, dropped "
+                f"(total dropped: {self.dropped_updates})")
+            return False
+        return True
+
+    async def _consume_updates(self) -> None:
+        """后台消费更新队列：每个更新到达即开始处理，并发数受信号量限制。"""
+        queue = self._update_queue
+        while True:
+            raw = await queue.get()
+            await self._update_semaphore.acquire()
+            task = asyncio.create_task(self._process_update(raw))
+            self._update_tasks.add(task)
+            task.add_done_callback(self._update_tasks.discard)
+
+    async def _process_update(self, raw: bytes) -> None:
+        """处理单个队列中的更新，结束后释放并发名额。"""
+        try:
+            await self.feed_update(raw)
+        except Exception:
+            logger.exception(f"Bot '{self.name}' failed to process update")
+        finally:
+            self._update_semaphore.release()
+            self._update_queue.task_done()
+
 
 class BotManager:
     """
@@ -129,6 +201,8 @@ class BotManager:
         Returns:
             BotInstance实例
         """
+        # 驻留名称字符串，webhook 查找时可走字典的指针比较快速路径
+        name = sys.intern(name)
         if name in self._bots:
             logger.warning(
                 f"Bot '{name}' already registered, will be replaced")
@@ -1,7 +1,5 @@
 """Common bot handlers: /start, /help, webapp launch."""
 
-import re
-
 from aiogram import Router
 from aiogram.filters import Command, CommandStart
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, Message, WebAppInfo
@@ -10,32 +8,46 @@ from app.core.config import settings
 
 router = Router(name="common")
 
+# MarkdownV2 特殊字符转义表
+_MD_TABLE = str.maketrans({c: "\\" + c for c in "_*[]()~`>#+-=|{}.!\\"})
+
 
 def escape_md(text: str) -> str:
     """转义 MarkdownV2 特殊字符。"""
-    return re.sub(r"([_*\[\]()~`>#+\-=|{}.!\\])", r"\\\1", text)
+    return text.translate(_MD_TABLE)
 
 
-@router.message(CommandStart())
-async def cmd_start(message: Message) -> None:
-    """处理 /start 命令，显示欢迎信息和WebApp入口。"""
-    keyboard = InlineKeyboardMarkup(
+# 运行期间不变的配置项，启动时计算一次
+_APP_NAME_MD = escape_md(settings.app_name)
+_main_bot = settings.bots.get_main_bot()
+_MAIN_APP_URL = _main_bot.app_url if _main_bot else None
+
+
+def _build_start_keyboard() -> InlineKeyboardMarkup:
+    """构建 /start 键盘，内容只依赖配置，启动时构建一次。"""
+    return InlineKeyboardMarkup(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
                     text="🎴 打开 {app_name}",
                     web_app=WebAppInfo(
-                        url=f"{settings.bots.get_main_bot().app_url}"),
+                        url=f"{_MAIN_APP_URL}"),
                 )
             ],
             [InlineKeyboardButton(text="📖 帮助", callback_data="help")],
         ]
     )
 
-    app_name = escape_md(settings.app_name)
+
+_START_KEYBOARD = _build_start_keyboard()
+
+
+@router.message(CommandStart())
+async def cmd_start(message: Message) -> None:
+    """处理 /start 命令，显示欢迎信息和WebApp入口。"""
     await message.answer(
-        f"👋 使用 {app_name} 的 WebApp",
-        reply_markup=keyboard,
+        f"👋 使用 {_APP_NAME_MD} 的 WebApp",
+        reply_markup=_START_KEYBOARD,
     )
 
 
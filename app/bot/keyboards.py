@@ -1,5 +1,7 @@
 """Keyboard builders for common UI patterns."""
 
+from functools import lru_cache
+
 from aiogram.types import (
     InlineKeyboardButton,
     InlineKeyboardMarkup,
@@ -8,6 +10,19 @@ from aiogram.types import (
     WebAppInfo,
 )
 
+# 按钮规格 (text, callback_data)，不可变，可安全缓存
+ButtonSpec = tuple[str, str]
+
+
+def _inline_markup(*rows: tuple[ButtonSpec, ...]) -> InlineKeyboardMarkup:
+    """由按钮规格构建新的Inline键盘。"""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text=text, callback_data=data) for text, data in row]
+            for row in rows
+        ]
+    )
+
 
 def webapp_keyboard(url: str, text: str = "🎴 打开游戏") -> InlineKeyboardMarkup:
     """创建WebApp启动按钮。"""
@@ -25,16 +40,25 @@ def confirm_keyboard(
     cancel_data: str = "cancel",
 ) -> InlineKeyboardMarkup:
     """创建确认/取消键盘。"""
-    return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=confirm_text, callback_data=confirm_data),
-                InlineKeyboardButton(
-                    text=cancel_text, callback_data=cancel_data),
-            ]
-        ]
-    )
+    return _inline_markup(((confirm_text, confirm_data), (cancel_text, cancel_data)))
+
+
+@lru_cache(maxsize=1024)
+def _pagination_row(
+    current_page: int, total_pages: int, callback_prefix: str
+) -> tuple[ButtonSpec, ...]:
+    """计算分页按钮规格（按参数缓存）。"""
+    buttons: list[ButtonSpec] = []
+
+    if current_page > 1:
+        buttons.append(("◀️", f"{callback_prefix}:{current_page - 1}"))
+
+    buttons.append((f"{current_page}/{total_pages}", "noop"))
+
+    if current_page < total_pages:
+        buttons.append(("▶️", f"{callback_prefix}:{current_page + 1}"))
+
+    return tuple(buttons)
 
 
 def pagination_keyboard(
@@ -43,35 +67,20 @@ def pagination_keyboard(
     callback_prefix: str = "page",
 ) -> InlineKeyboardMarkup:
     """创建分页键盘。"""
-    buttons = []
-
-    if current_page > 1:
-        buttons.append(
-            InlineKeyboardButton(
-                text="◀️", callback_data=f"{callback_prefix}:{current_page - 1}")
-        )
-
-    buttons.append(
-        InlineKeyboardButton(
-            text=f"{current_page}/{total_pages}", callback_data="noop")
-    )
+    return _inline_markup(_pagination_row(current_page, total_pages, callback_prefix))
 
-    if current_page < total_pages:
-        buttons.append(
-            InlineKeyboardButton(
-                text="▶️", callback_data=f"{callback_prefix}:{current_page + 1}")
-        )
 
-    return InlineKeyboardMarkup(inline_keyboard=[buttons])
+# 主菜单按钮文本固定
+_MAIN_MENU_ROWS = (
+    ("🎴 抽卡", "🎒 背包"),
+    ("🎰 PVP转盘", "📊 排行榜"),
+    ("👤 我的", "❓ 帮助"),
+)
 
 
 def main_menu_keyboard() -> ReplyKeyboardMarkup:
     """创建主菜单Reply键盘。"""
     return ReplyKeyboardMarkup(
-        keyboard=[
-            [KeyboardButton(text="🎴 抽卡"), KeyboardButton(text="🎒 背包")],
-            [KeyboardButton(text="🎰 PVP转盘"), KeyboardButton(text="📊 排行榜")],
-            [KeyboardButton(text="👤 我的"), KeyboardButton(text="❓ 帮助")],
-        ],
+        keyboard=[[KeyboardButton(text=text) for text in row] for row in _MAIN_MENU_ROWS],
         resize_keyboard=True,
     )
@@ -1,5 +1,7 @@
 """Bot middlewares for logging, throttling, etc."""
 
+import time
+from collections import OrderedDict
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -56,7 +58,8 @@ class LoggingMiddleware(BaseMiddleware):
                 user = event.callback_query.from_user
 
             if user:
-                logger.debug(f"Update from user {user.id} (@{user.username})")
+                # 使用 loguru 参数格式化，日志级别被过滤时不会拼接字符串
+                logger.debug("Update from user {} (@{})", user.id, user.username)
 
         return await handler(event, data)
 
@@ -64,9 +67,12 @@ class LoggingMiddleware(BaseMiddleware):
 class ThrottlingMiddleware(BaseMiddleware):
     """简单的限流中间件，防止用户刷屏。"""
 
-    def __init__(self, rate_limit: float = 0.5) -> None:
+    def __init__(self, rate_limit: float = 0.5, max_users: int = 100_000) -> None:
         self.rate_limit = rate_limit
-        self._user_last_time: dict[int, float] = {}
+        self.rate_limit_ns = int(rate_limit * 1_000_000_000)
+        self.max_users = max_users
+        # 按最近访问排序，超出 max_users 时淘汰最久未访问的用户
+        self._user_last_time: OrderedDict[int, int] = OrderedDict()
 
     async def __call__(
         self,
@@ -74,8 +80,6 @@ class ThrottlingMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: dict[str, Any],
     ) -> Any:
-        import time
-
         user_id = None
         if isinstance(event, Update):
             if event.message and event.message.from_user:
@@ -84,12 +88,15 @@ class ThrottlingMiddleware(BaseMiddleware):
                 user_id = event.callback_query.from_user.id
 
         if user_id:
-            now = time.time()
-            last_time = self._user_last_time.get(user_id, 0)
-            if now - last_time < self.rate_limit:
+            now_ns = time.monotonic_ns()
+            last_ns = self._user_last_time.get(user_id)
+            if last_ns is not None and now_ns - last_ns < self.rate_limit_ns:
                 logger.debug(f"Throttled user {user_id}")
                 return None
-            self._user_last_time[user_id] = now
+            self._user_last_time[user_id] = now_ns
+            self._user_last_time.move_to_end(user_id)
+            if len(self._user_last_time) > self.max_users:
+                self._user_last_time.popitem(last=False)
 
         return await handler(event, data)
 
@@ -1,13 +1,19 @@
 """Application settings loaded from YAML configuration files."""
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import BaseModel, Field, RootModel
 
+try:
+    # 优先使用 libyaml 的 C 实现
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class DatabaseSettings(BaseModel):
     """数据库配置。"""
@@ -33,6 +39,8 @@ class RedisSettings(BaseModel):
 
     url: str = Field(default="redis://localhost:6379/0", description="Redis连接URL, 必填")
     password: str | None = Field(default=None, description="Redis密码, 可选")
+    max_connections: int = Field(default=50, ge=1, description="连接池最大连接数, 可选, 默认50")
+    pool_timeout: float = Field(default=5, ge=0, description="连接池满时等待空闲连接的超时时间, 可选, 默认5秒")
 
 class BotConfig(BaseModel):
     """单个Bot配置。"""
@@ -56,16 +64,25 @@ class BotSettings(RootModel[list[BotConfig]]):
     def __len__(self):
         return len(self.root)
 
+    @cached_property
+    def _main_bot(self) -> BotConfig | None:
+        return self.root[0] if self.root else None
+
+    @cached_property
+    def _by_name(self) -> dict[str, BotConfig]:
+        # 同名时保留第一个，与原线性查找行为一致
+        by_name: dict[str, BotConfig] = {}
+        for bot in self.root:
+            by_name.setdefault(bot.name, bot)
+        return by_name
+
     def get_main_bot(self) -> BotConfig | None:
         """获取主Bot配置（第一个）。"""
-        return self.root[0] if self.root else None
+        return self._main_bot
 
     def get_by_name(self, name: str) -> BotConfig | None:
         """根据名称获取Bot配置。"""
-        for bot in self.root:
-            if bot.name == name:
-                return bot
-        return None
+        return self._by_name.get(name)
 
 
 class LogSettings(BaseModel):
@@ -92,14 +109,17 @@ class Settings(BaseModel):
 
 
 def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
-    """Deep merge two dictionaries, override takes precedence."""
-    result = base.copy()
+    """Deep merge override into base in place, override takes precedence.
+
+    base is mutated and returned; callers must pass a dict they own.
+    """
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _deep_merge(result[key], value)
+        existing = base.get(key)
+        if isinstance(existing, dict) and isinstance(value, dict):
+            _deep_merge(existing, value)
         else:
-            result[key] = value
-    return result
+            base[key] = value
+    return base
 
 
 def _get_project_root() -> Path:
@@ -115,14 +135,15 @@ def _load_yaml_config(env: str) -> dict[str, Any]:
     base_file = project_root / "base.config.yml"
     if base_file.exists():
         with open(base_file, encoding="utf-8") as f:
-            base_config = yaml.safe_load(f) or {}
+            base_config = yaml.load(f, Loader=_YamlLoader) or {}
 
     env_config: dict[str, Any] = {}
     env_file = project_root / f"{env}.config.yml"
     if env_file.exists():
         with open(env_file, encoding="utf-8") as f:
-            env_config = yaml.safe_load(f) or {}
+            env_config = yaml.load(f, Loader=_YamlLoader) or {}
 
+    # base_config 为本次新加载的数据，可直接原地合并
     merged = _deep_merge(base_config, env_config)
     merged["env"] = env
     return merged
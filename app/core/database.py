@@ -1,11 +1,13 @@
 """Database initialization and session management."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import get_settings
+from app.core.logger import logger
 from app.utils.snowflake import init_snowflake
 
 engine: AsyncEngine | None = None
@@ -27,10 +29,27 @@ async def init_database() -> None:
     )
     async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
     init_snowflake()
-    # 初始化序列号
+    # 初始化序列号（一次性启动任务，直接使用连接，无需创建 Session）
     from app.utils.sequence import init_all_sequences
-    async with async_session_factory() as session:
-        await init_all_sequences(session)
+    async with engine.connect() as conn:
+        await init_all_sequences(conn)
+    await _prewarm_pool(engine, settings.database.pool_size)
+
+
+async def _prewarm_pool(engine: AsyncEngine, size: int) -> None:
+    """预先建立 pool_size 个连接并归还连接池，避免首批请求承担握手开销
+
+    预热只是优化，部分连接失败时仅记录警告，不影响启动。
+    """
+    conns = [engine.connect() for _ in range(size)]
+    results = await asyncio.gather(*(conn.start() for conn in conns), return_exceptions=True)
+    await asyncio.gather(
+        *(conn.close() for conn in conns if conn.sync_connection is not None),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        logger.warning(f"Database pool prewarm: {len(errors)}/{size} connections failed: {errors[0]!r}")
 
 
 async def close_database() -> None:
@@ -3,7 +3,7 @@
 模块化日志系统:
 - 通用日志: logs/app.log (所有日志)
 - 错误日志: logs/error.log (ERROR 及以上级别)
-- 模块日志: logs/{module}.log (如 payment.log, scheduler.log)
+- 模块日志: logs/{module}.log (如 payment.log, scheduler.log，JSON Lines 格式)
 
 使用方法:
     from app.core.logger import logger, get_module_logger
@@ -14,33 +14,68 @@
     # 模块日志（同时写入 app.log 和对应模块日志文件）
     payment_logger = get_module_logger("payment")
     payment_logger.info("支付相关日志")
+
+文件日志通过 enqueue=True 由后台线程写入，应用关闭时需 await logger.complete()
+确保队列中的日志全部落盘。
 """
 
+import gzip
 import logging
 import os
+import re
+import shutil
 import sys
-from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
 
+import orjson
 from loguru import logger as _logger
 
 from app.core.config import settings
 
+# 日志格式（控制台与文件共用，非彩色 sink 会由 loguru 自动去掉颜色标签）
+# worker_id/source 来自 record["extra"]
+LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<yellow>[{extra[worker_id]}]</yellow> | "
+    "<cyan>{extra[source]}</cyan> | "
+    "<level>{message}</level>"
+)
 
-# Worker 标识（使用 PID 后三位）
-# 注意：不缓存，因为 gunicorn fork 后 PID 会变化
-def _get_worker_id() -> str:
-    """获取 Worker 标识（PID 后三位）"""
-    pid = os.getpid()
-    return f"P{pid % 1000:03d}"
+# 日志目录
+LOG_DIR = Path("logs")
 
 # 需要独立日志文件的模块
 MODULE_LOG_FILES = ("payment", "pvp", "scheduler", "forge", "cli")
 
 # 模块与第三方库的映射（第三方库日志写入对应模块日志文件）
 MODULE_SOURCE_MAPPING = {
-    "scheduler": ("[apscheduler]",),
+    "scheduler": frozenset({"[apscheduler]"}),
 }
 
+# 第三方库 source -> 模块名（由 MODULE_SOURCE_MAPPING 反推）
+_SOURCE_TO_MODULE = {
+    source: module_name
+    for module_name, sources in MODULE_SOURCE_MAPPING.items()
+    for source in sources
+}
+
+# 模块日志轮转保留的备份文件数
+MODULE_LOG_BACKUP_COUNT = 10
+
+# 模块日志轮转大小的默认值（rotation 配置不是大小格式时使用）
+DEFAULT_MODULE_LOG_MAX_BYTES = 10 * 1000 * 1000
+
+# 大小单位前缀（与 loguru 一致：KB/MB 为 1000 进制，KiB/MiB 为 1024 进制）
+_SIZE_PREFIXES = "kmgtpezy"
+_SIZE_PATTERN = re.compile(r"([\d.]+)\s*([kmgtpezy])?(i)?(b)", re.IGNORECASE)
+
+# 轮转日志的 gzip 压缩级别（日志文本在低级别下压缩率已足够，CPU 开销低得多）
+LOG_COMPRESS_LEVEL = 1
+
 # 第三方库 logger 名称前缀
 THIRD_PARTY_LOGGERS = frozenset({
     "uvicorn", "fastapi", "starlette", "sqlalchemy", "aiogram",
@@ -60,86 +95,185 @@ THIRD_PARTY_LOG_LEVELS = {
 }
 
 
+# 标准 logging 级别名 -> loguru 级别名（其他级别直接使用 levelno）
+_LEVEL_CACHE = {
+    name: _logger.level(name).name
+    for name in ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+}
+
+
+@lru_cache(maxsize=512)
+def _classify(name: str) -> tuple[bool, str]:
+    """按 logger 名称判断是否第三方库，返回 (是否第三方库, [库名] 标签)"""
+    top_module = (name or "unknown").split(".", 1)[0]
+    return top_module in THIRD_PARTY_LOGGERS, f"[{top_module}]"
+
+
+@lru_cache(maxsize=4096)
+def _source_string(pathname: str, func_name: str, lineno: int) -> str:
+    """按调用位置缓存 "文件名:函数:行号"（驻留字符串，避免每条日志重新拼接）"""
+    return sys.intern(f"{pathname.rpartition(os.sep)[2]}:{func_name}:{lineno}")
+
+
 class InterceptHandler(logging.Handler):
     """拦截标准 logging 并转发到 loguru"""
 
     def emit(self, record: logging.LogRecord) -> None:
-        try:
-            level = _logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
-
-        top_module = (record.name or "unknown").split(".")[0]
+        level = _LEVEL_CACHE.get(record.levelname, record.levelno)
+        is_third_party, source_tag = _classify(record.name)
 
-        if top_module in THIRD_PARTY_LOGGERS:
+        if is_third_party:
             # 第三方库：显示 [库名] 格式
-            _logger.bind(source=f"[{top_module}]").opt(
+            _logger.bind(source=source_tag).opt(
                 exception=record.exc_info
             ).log(level, record.getMessage())
         else:
             # 使用 record 自带的调用位置信息（logging 已经计算好了真实调用者）
-            filename = os.path.basename(record.pathname)
-            source = f"{filename}:{record.funcName}:{record.lineno}"
+            source = _source_string(record.pathname, record.funcName, record.lineno)
             _logger.bind(source=source).opt(exception=record.exc_info).log(
                 level, record.getMessage()
             )
 
 
-def _get_location(record: dict) -> str:
-    """获取日志位置信息"""
-    extra = record["extra"]
-    if "source" in extra:
-        return extra["source"]
-    return f"{record['name']}:{record['function']}:{record['line']}"
-
-
-def _console_format(record: dict) -> str:
-    """控制台格式（带颜色）"""
-    location = _get_location(record)
-    worker_id = _get_worker_id()
-    return (
-        f"<green>{{time:YYYY-MM-DD HH:mm:ss}}</green> | "
-        f"<level>{{level: <8}}</level> | "
-        f"<yellow>[{worker_id}]</yellow> | "
-        f"<cyan>{location}</cyan> | "
-        f"<level>{{message}}</level>\n"
-    )
+# 全局共用的拦截 handler（无状态，所有 logger 共享一个实例）
+_INTERCEPT = InterceptHandler()
+
+
+def _format_worker_id() -> str:
+    """根据当前 PID 生成 Worker 标识（PID 后三位）"""
+    return f"P{os.getpid() % 1000:03d}"
+
+
+# 当前进程的 Worker 标识（fork 后在子进程中刷新）
+_WORKER_ID = _format_worker_id()
+
+
+def _refresh_worker_id() -> None:
+    """fork 后刷新子进程的 Worker 标识，并同步到 loguru 的默认 extra"""
+    global _WORKER_ID
+    _WORKER_ID = _format_worker_id()
+    _logger.configure(extra={"worker_id": _WORKER_ID})
 
 
-def _file_format(record: dict) -> str:
-    """文件格式（纯文本）"""
-    location = _get_location(record)
-    worker_id = _get_worker_id()
-    return (
-        f"{{time:YYYY-MM-DD HH:mm:ss}} | "
-        f"{{level: <8}} | "
-        f"[{worker_id}] | "
-        f"{location} | "
-        f"{{message}}\n"
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_refresh_worker_id)
+
+
+def _get_worker_id() -> str:
+    """获取 Worker 标识（PID 后三位）"""
+    return _WORKER_ID
+
+
+def _patch_source(record: dict) -> None:
+    """未绑定 source 时使用调用位置（InterceptHandler 绑定的 source 优先）"""
+    record["extra"].setdefault(
+        "source", f"{record['name']}:{record['function']}:{record['line']}"
     )
 
 
-def _create_module_filter(module_name: str) -> Callable[[dict], bool]:
-    """创建模块日志过滤器"""
-    allowed_sources = MODULE_SOURCE_MAPPING.get(module_name, ())
+# 轮转日志后台压缩线程池（单线程，首次轮转时创建）
+_compress_executor: ThreadPoolExecutor | None = None
 
-    def _filter(record: dict) -> bool:
-        extra = record.get("extra", {})
-        return (
-            extra.get("module") == module_name or
-            extra.get("source") in allowed_sources
+
+def _compress_file(path: str) -> None:
+    """将轮转出的日志文件压缩为 .gz 并删除原文件"""
+    with open(path, "rb") as src, gzip.open(
+        f"{path}.gz", "wb", compresslevel=LOG_COMPRESS_LEVEL
+    ) as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(path)
+
+
+def _schedule_compress(path: str) -> None:
+    """loguru compression 回调：提交到后台线程压缩，不阻塞日志写入线程"""
+    global _compress_executor
+    if _compress_executor is None:
+        _compress_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="log-compress"
         )
-    return _filter
+    _compress_executor.submit(_compress_file, path)
+
+
+def _parse_size(text: str) -> int:
+    """按 loguru 的规则解析 "10 MB" / "500 KiB" 形式的大小配置，无法解析时返回默认值"""
+    match = _SIZE_PATTERN.fullmatch(text.strip())
+    try:
+        number = float(match.group(1)) if match else None
+    except ValueError:
+        number = None
+    if number is None:
+        _logger.warning(
+            f"Log rotation '{text}' is not a size, module logs rotate at "
+            f"{DEFAULT_MODULE_LOG_MAX_BYTES} bytes"
+        )
+        return DEFAULT_MODULE_LOG_MAX_BYTES
+
+    prefix, binary, unit = match.group(2), match.group(3), match.group(4)
+    power = _SIZE_PREFIXES.index(prefix.lower()) + 1 if prefix else 0
+    # 小写 b 表示 bit（与 loguru 一致）
+    return int(number * (1024 if binary else 1000) ** power / (8 if unit == "b" else 1))
+
+
+class _ModuleLogSink:
+    """模块日志分发 sink
+
+    所有模块日志共用一个 loguru handler，按 extra["module"]（或第三方库 source）
+    一次字典查找路由到对应的 logs/{module}.log，按大小轮转。
+    模块日志主要供程序分析，使用 orjson 写为 JSON Lines（每行一条记录）。
+    """
+
+    def __init__(self, log_dir: Path, max_bytes: int) -> None:
+        formatter = logging.Formatter("%(message)s")
+        self._handlers: dict[str, RotatingFileHandler] = {}
+        for module_name in MODULE_LOG_FILES:
+            handler = RotatingFileHandler(
+                log_dir / f"{module_name}.log",
+                maxBytes=max_bytes,
+                backupCount=MODULE_LOG_BACKUP_COUNT,
+                encoding="utf-8",
+                delay=True,
+            )
+            handler.setFormatter(formatter)
+            self._handlers[module_name] = handler
+
+    def write(self, message) -> None:
+        record = message.record
+        extra = record["extra"]
+        module_name = extra.get("module") or _SOURCE_TO_MODULE.get(extra.get("source"))
+        handler = self._handlers.get(module_name)
+        if handler is None:
+            return
+
+        payload = {
+            "ts": record["time"].timestamp(),
+            "lvl": record["level"].name,
+            "worker": extra.get("worker_id"),
+            "src": extra.get("source"),
+            "msg": record["message"],
+        }
+        if record["exception"] is not None:
+            # sink 格式为 "{message}"，消息之后即为 loguru 格式化好的异常堆栈
+            payload["exc"] = message[len(record["message"]):].strip()
+        handler.emit(logging.makeLogRecord({"msg": orjson.dumps(payload).decode()}))
+
+    def stop(self) -> None:
+        for handler in self._handlers.values():
+            handler.close()
 
 
 def init_logger() -> None:
     """初始化日志系统"""
     _logger.remove()
+    # 日志目录只创建一次，各 sink 直接使用绝对路径
+    log_dir = LOG_DIR.absolute()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    # worker_id 按进程缓存，fork 出的子进程由 _refresh_worker_id 刷新
+    _logger.configure(extra={"worker_id": _get_worker_id()}, patcher=_patch_source)
 
     # 控制台输出
     _logger.add(
         sys.stderr,
-        format=_console_format,
+        format=LOG_FORMAT,
         level=settings.log.level,
         colorize=True,
         backtrace=True,
@@ -147,39 +281,54 @@ def init_logger() -> None:
     )
     # 错误日志（只记录 ERROR 及以上级别）
     _logger.add(
-        "logs/error.log",
-        format=_file_format,
+        log_dir / "error.log",
+        format=LOG_FORMAT,
         level="ERROR",
         rotation=settings.log.rotation,
         retention=settings.log.retention,
-        compression="zip",
+        compression="zip",  # 错误日志体积小，保留 zip
         backtrace=True,
         diagnose=True,  # 错误日志开启详细诊断
+        enqueue=True,
+        catch=True,
     )
     # 文件输出（非 debug 模式）
     if not settings.debug:
         file_config = {
-            "format": _file_format,
+            "format": LOG_FORMAT,
             "level": settings.log.level,
             "rotation": settings.log.rotation,
             "retention": settings.log.retention,
-            "compression": "zip",
+            # 轮转后交给后台线程 gzip 压缩
+            "compression": _schedule_compress,
             "backtrace": True,
             "diagnose": False,
+            # 由后台线程写文件，避免磁盘 I/O 和轮转压缩阻塞事件循环
+            "enqueue": True,
+            "catch": True,
         }
 
         # 通用日志
-        _logger.add("logs/app.log", **file_config)
-        # 模块日志
-        for module_name in MODULE_LOG_FILES:
-            _logger.add(
-                f"logs/{module_name}.log",
-                filter=_create_module_filter(module_name),
-                **file_config,
-            )
+        _logger.add(log_dir / "app.log", **file_config)
+        # 模块日志（单个 sink 按模块分发）
+        _logger.add(
+            _ModuleLogSink(log_dir, _parse_size(settings.log.rotation)),
+            format="{message}",
+            level=settings.log.level,
+            backtrace=True,
+            diagnose=False,
+            enqueue=True,
+            catch=True,
+        )
 
     # 拦截标准 logging
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    logging.basicConfig(handlers=[_INTERCEPT], level=0, force=True)
+
+    # 已创建的第三方库 logger 统一改为拦截 handler（级别仍继承父 logger）
+    for name, log in list(logging.root.manager.loggerDict.items()):
+        if isinstance(log, logging.Logger) and name.split(".", 1)[0] in THIRD_PARTY_LOGGERS:
+            log.handlers = [_INTERCEPT]
+            log.propagate = False
 
     # 配置第三方库日志级别
     for name, level in THIRD_PARTY_LOG_LEVELS.items():
@@ -204,7 +353,7 @@ def _configure_logger(name: str, level: str) -> None:
     """配置单个 logger"""
     log = logging.getLogger(name)
     log.setLevel(level)
-    log.handlers = [InterceptHandler()]
+    log.handlers = [_INTERCEPT]
     log.propagate = False
 
 
@@ -214,7 +363,7 @@ def get_module_logger(module_name: str):
     日志会写入 logs/app.log，如果模块在 MODULE_LOG_FILES 中，
     还会写入 logs/{module}.log
     """
-    return _logger.bind(module=module_name)
+    return _logger.bind(module=sys.intern(module_name))
 
 
 # 导出
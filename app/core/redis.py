@@ -1,28 +1,38 @@
 """Redis initialization and client management."""
 
+import asyncio
+
 from redis import asyncio as aioredis
 
 from app.core.config import get_settings
 from app.core.logger import logger
 
+# 启动时预先建立的 Redis 连接数（不超过 max_connections）
+REDIS_PREWARM_CONNECTIONS = 10
+
+redis_pool: aioredis.BlockingConnectionPool | None = None
 redis_client: aioredis.Redis | None = None
 
 
 async def init_redis() -> aioredis.Redis:
     """Initialize Redis client."""
-    global redis_client
+    global redis_pool, redis_client
     # Use get_settings() to always get current settings (important for env switching)
     settings = get_settings()
-    redis_client = await aioredis.from_url(
+    # 连接数达到上限时等待空闲连接（最多 pool_timeout 秒），而不是无限新建连接
+    redis_pool = aioredis.BlockingConnectionPool.from_url(
         settings.redis.url,
+        max_connections=settings.redis.max_connections,
+        timeout=settings.redis.pool_timeout,
         encoding="utf-8",
         decode_responses=True,
         password=settings.redis.password,
-        max_connections=50
     )
-    # 验证连接是否成功
-    pong = await redis_client.ping()
-    if pong:
+    redis_client = aioredis.Redis(connection_pool=redis_pool)
+    # 并发 ping 验证连接，同时预先建立连接池中的连接
+    prewarm = min(settings.redis.max_connections, REDIS_PREWARM_CONNECTIONS)
+    pongs = await asyncio.gather(*(redis_client.ping() for _ in range(prewarm)))
+    if all(pongs):
         logger.info(f"Redis connection established successfully (URL: {settings.redis.url})")
     else:
         logger.error("Redis connection failed: ping returned False")
@@ -32,11 +42,14 @@ async def init_redis() -> aioredis.Redis:
 
 async def close_redis() -> None:
     """Close Redis connection."""
-    global redis_client
+    global redis_pool, redis_client
     if redis_client is not None:
         await redis_client.close()
         logger.info("Redis client closed")
         redis_client = None
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+        redis_pool = None
 
 
 def get_redis() -> aioredis.Redis:
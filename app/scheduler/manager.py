@@ -8,9 +8,8 @@
 - 分布式锁支持（多实例部署）
 """
 
-import functools
-import uuid
-from collections.abc import Awaitable, Callable
+import secrets
+from collections.abc import Awaitable, Callable, Iterator
 from datetime import datetime
 from typing import Any
 
@@ -18,6 +17,8 @@ from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, JobEvent
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.util import get_callable_name
+from redis.commands.core import AsyncScript
 
 from app.core.logger import get_module_logger
 
@@ -56,7 +57,8 @@ class SchedulerManager:
     def __init__(self):
         self._scheduler: AsyncIOScheduler | None = None
         self._is_running: bool = False
-        self._release_lock_sha: str | None = None  # Lua 脚本 SHA
+        self._release_script: AsyncScript | None = None  # 释放锁的 Lua 脚本
+        self._job_count: int = 0  # 已注册任务数（避免 get_jobs() 构建完整列表）
 
     @property
     def scheduler(self) -> AsyncIOScheduler:
@@ -115,7 +117,7 @@ class SchedulerManager:
         self._scheduler.start()
         self._is_running = True
 
-        logger.info(f"Scheduler started with {len(self._scheduler.get_jobs())} jobs")
+        logger.info(f"Scheduler started with {self._job_count} jobs")
 
     async def stop(self) -> None:
         """
@@ -172,13 +174,18 @@ class SchedulerManager:
         if distributed:
             job_func = self._wrap_with_distributed_lock(func, job_id, lock_ttl)
 
+        # 替换同名任务时不重复计数
+        is_new_job = self.scheduler.get_job(job_id) is None
         self.scheduler.add_job(
             job_func,
             trigger=trigger,
             id=job_id,
+            name=get_callable_name(func),
             replace_existing=replace_existing,
             kwargs=kwargs,
         )
+        if is_new_job:
+            self._job_count += 1
 
         lock_info = f", distributed_lock=True, ttl={lock_ttl}s" if distributed else ""
         logger.info(f"Added interval job: {job_id} (every {hours}h {minutes}m {seconds}s{lock_info})")
@@ -224,13 +231,18 @@ class SchedulerManager:
         if distributed:
             job_func = self._wrap_with_distributed_lock(func, job_id, lock_ttl)
 
+        # 替换同名任务时不重复计数
+        is_new_job = self.scheduler.get_job(job_id) is None
         self.scheduler.add_job(
             job_func,
             trigger=trigger,
             id=job_id,
+            name=get_callable_name(func),
             replace_existing=replace_existing,
             kwargs=kwargs,
         )
+        if is_new_job:
+            self._job_count += 1
 
         lock_info = f", distributed_lock=True, ttl={lock_ttl}s" if distributed else ""
         logger.info(f"Added cron job: {job_id}{lock_info}")
@@ -247,6 +259,7 @@ class SchedulerManager:
         """
         try:
             self.scheduler.remove_job(job_id)
+            self._job_count -= 1
             logger.info(f"Removed job: {job_id}")
             return True
         except Exception:
@@ -283,17 +296,15 @@ class SchedulerManager:
             "trigger": str(job.trigger),
         }
 
-    def list_jobs(self) -> list[dict]:
-        """列出所有任务"""
-        return [
-            {
+    def list_jobs(self) -> Iterator[dict]:
+        """列出所有任务（生成器，调用方可提前结束迭代）"""
+        for job in self.scheduler.get_jobs():
+            yield {
                 "id": job.id,
                 "name": job.name,
                 "next_run_time": job.next_run_time,
                 "trigger": str(job.trigger),
             }
-            for job in self.scheduler.get_jobs()
-        ]
 
     def _register_jobs(self) -> None:
         """
@@ -313,7 +324,7 @@ class SchedulerManager:
 
     def _on_job_executed(self, event: JobEvent) -> None:
         """任务执行成功回调"""
-        logger.debug(f"Job executed: {event.job_id}")
+        logger.debug("Job executed: {}", event.job_id)
 
     def _on_job_error(self, event: JobEvent) -> None:
         """任务执行失败回调"""
@@ -323,106 +334,88 @@ class SchedulerManager:
     # 分布式锁相关方法
     # =========================================================================
 
-    async def _acquire_lock(self, job_id: str, ttl: int = DEFAULT_LOCK_TTL) -> str | None:
-        """
-        尝试获取分布式锁
-
-        Args:
-            job_id: 任务 ID（用于生成锁 Key）
-            ttl: 锁超时时间（秒）
-
-        Returns:
-            成功返回锁 token，失败返回 None
-        """
-        from app.core import get_redis
-
-        redis = get_redis()
-        lock_key = f"{LOCK_KEY_PREFIX}{job_id}"
-        lock_token = str(uuid.uuid4())
-
-        # SET NX EX：仅当 key 不存在时设置，并设置过期时间
-        acquired = await redis.set(lock_key, lock_token, nx=True, ex=ttl)
-
-        if acquired:
-            logger.debug(f"Distributed lock acquired: job={job_id}, token={lock_token[:8]}")
-            return lock_token
-        else:
-            logger.debug(f"Distributed lock not acquired (already held): job={job_id}")
-            return None
+    def _get_release_script(self, redis) -> AsyncScript:
+        """获取释放锁的 Lua 脚本对象（只注册一次）"""
+        # EVALSHA 遇到 NOSCRIPT（如 Redis 重启）时自动重新加载
+        if self._release_script is None:
+            self._release_script = redis.register_script(RELEASE_LOCK_SCRIPT)
+        return self._release_script
 
-    async def _release_lock(self, job_id: str, token: str) -> bool:
+    def _wrap_with_distributed_lock(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        job_id: str,
+        lock_ttl: int = DEFAULT_LOCK_TTL,
+    ) -> Callable[..., Awaitable[Any]]:
         """
-        安全释放分布式锁
-
-        使用 Lua 脚本确保只有锁的所有者才能释放。
+        包装任务函数，添加分布式锁
 
         Args:
+            func: 原始任务函数
             job_id: 任务 ID
-            token: 获取锁时返回的 token
+            lock_ttl: 锁超时时间
 
         Returns:
-            是否成功释放
+            包装后的协程函数（_LockedJob.run 绑定方法）
         """
-        from app.core import get_redis
+        return _LockedJob(self, func, job_id, lock_ttl).run
 
-        redis = get_redis()
-        lock_key = f"{LOCK_KEY_PREFIX}{job_id}"
 
-        # 使用 Lua 脚本安全释放锁
-        # 缓存脚本 SHA 以提高性能
-        if self._release_lock_sha is None:
-            self._release_lock_sha = await redis.script_load(RELEASE_LOCK_SCRIPT)
-
-        try:
-            result = await redis.evalsha(self._release_lock_sha, 1, lock_key, token)
-            released = result == 1
+class _LockedJob:
+    """
+    带分布式锁的任务
 
-            if released:
-                logger.debug(f"Distributed lock released: job={job_id}")
-            else:
-                logger.warning(f"Distributed lock release failed (not owner): job={job_id}")
+    锁 Key 在注册时预先生成，获取/释放锁内联在 run 中，每次执行只有一层协程。
+    注册到 APScheduler 的是绑定方法 run（APScheduler 依据 iscoroutinefunction
+    判断是否在事件循环中执行，可调用实例无法被识别为协程函数）。
+    """
 
-            return released
-        except Exception as e:
-            # 如果脚本不存在（Redis 重启），重新加载
-            logger.warning(f"Lock release error, retrying with EVAL: {e}")
-            result = await redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
-            return result == 1
+    __slots__ = ("_manager", "_func", "_job_id", "_key", "_ttl")
 
-    def _wrap_with_distributed_lock(
+    def __init__(
         self,
+        manager: SchedulerManager,
         func: Callable[..., Awaitable[Any]],
         job_id: str,
-        lock_ttl: int = DEFAULT_LOCK_TTL,
-    ) -> Callable[..., Awaitable[Any]]:
-        """
-        包装任务函数，添加分布式锁
+        ttl: int,
+    ) -> None:
+        self._manager = manager
+        self._func = func
+        self._job_id = job_id
+        self._key = f"{LOCK_KEY_PREFIX}{job_id}"
+        self._ttl = ttl
+
+    async def run(self, *args: Any, **kwargs: Any) -> Any:
+        """获取锁后执行任务，结束后安全释放锁"""
+        from app.core import get_redis
 
-        Args:
-            func: 原始任务函数
-            job_id: 任务 ID
-            lock_ttl: 锁超时时间
+        redis = get_redis()
+        token = secrets.token_hex(16)
 
-        Returns:
-            包装后的函数
-        """
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # 尝试获取锁
-            token = await self._acquire_lock(job_id, lock_ttl)
-            if token is None:
-                # 获取锁失败，跳过本次执行
-                logger.info(f"Job skipped (lock not acquired): {job_id}")
-                return None
+        # SET NX EX：仅当 key 不存在时设置，并设置过期时间
+        if not await redis.set(self._key, token, nx=True, ex=self._ttl):
+            # 获取锁失败，跳过本次执行
+            logger.info(f"Job skipped (lock not acquired): {self._job_id}")
+            return None
 
+        logger.debug("Distributed lock acquired: job={}, token={}", self._job_id, token[:8])
+        try:
+            # 执行原始任务
+            return await self._func(*args, **kwargs)
+        finally:
+            # 无论成功失败，都使用 Lua 脚本安全释放锁
             try:
-                # 执行原始任务
-                return await func(*args, **kwargs)
-            finally:
-                # 无论成功失败，都释放锁
-                await self._release_lock(job_id, token)
-
-        return wrapper
+                result = await self._manager._get_release_script(redis)(
+                    keys=[self._key], args=[token], client=redis
+                )
+            except Exception as e:
+                # 释放失败时锁会在 TTL 到期后自动失效
+                logger.warning(f"Distributed lock release error: job={self._job_id}, {e}")
+            else:
+                if result == 1:
+                    logger.debug("Distributed lock released: job={}", self._job_id)
+                else:
+                    logger.warning(f"Distributed lock release failed (not owner): job={self._job_id}")
 
 
 # 全局调度管理器实例
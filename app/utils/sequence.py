@@ -4,7 +4,7 @@ import random
 from datetime import datetime
 from enum import Enum
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
 
 
 class SeqKey(str, Enum):
@@ -63,7 +63,7 @@ async def generate_sequence_id(
 
 
 async def init_sequence(
-    db: AsyncSession, seq_key: str | SeqKey, *,
+    db: AsyncSession | AsyncConnection, seq_key: str | SeqKey, *,
     current_value: int = 1000000, step_min: int = 1, step_max: int = 1,
     prefix: str | None = None, description: str | None = None,
 ) -> None:
@@ -87,7 +87,7 @@ async def init_sequence(
     await db.commit()
 
 
-async def init_all_sequences(db: AsyncSession) -> None:
+async def init_all_sequences(db: AsyncSession | AsyncConnection) -> None:
     """初始化所有预定义序列"""
     for seq_key in SEQ_INIT_CONFIG:
         await init_sequence(db, seq_key)
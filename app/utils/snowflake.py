@@ -44,32 +44,43 @@ class SnowflakeGenerator:
         self._lock = Lock()
 
     def _current_millis(self) -> int:
-        return int(time.time() * 1000)
+        return time.time_ns() // 1_000_000
 
     def _wait_next_millis(self, last_timestamp: int) -> int:
         timestamp = self._current_millis()
         while timestamp <= last_timestamp:
+            # Sleep instead of spinning so the GIL is released while waiting
+            time.sleep(0.0005)
             timestamp = self._current_millis()
         return timestamp
 
-    def generate(self) -> int:
-        """Generate a unique snowflake ID (53-bit, JS safe)."""
-        with self._lock:
-            timestamp = self._current_millis()
+    def _next_id(self) -> int:
+        """Generate the next ID. Caller must hold self._lock."""
+        timestamp = self._current_millis()
 
-            if timestamp < self.last_timestamp:
-                raise RuntimeError(f"Clock moved backwards. Refusing to generate id for {self.last_timestamp - timestamp} milliseconds")
+        if timestamp < self.last_timestamp:
+            raise RuntimeError(f"Clock moved backwards. Refusing to generate id for {self.last_timestamp - timestamp} milliseconds")
 
-            if timestamp == self.last_timestamp:
-                self.sequence = (self.sequence + 1) & self.MAX_SEQUENCE
-                if self.sequence == 0:
-                    timestamp = self._wait_next_millis(self.last_timestamp)
-            else:
-                self.sequence = 0
+        if timestamp == self.last_timestamp:
+            self.sequence = (self.sequence + 1) & self.MAX_SEQUENCE
+            if self.sequence == 0:
+                timestamp = self._wait_next_millis(self.last_timestamp)
+        else:
+            self.sequence = 0
 
-            self.last_timestamp = timestamp
+        self.last_timestamp = timestamp
 
-            return ((timestamp - self.epoch) << self.TIMESTAMP_SHIFT) | (self.machine_id << self.MACHINE_SHIFT) | self.sequence
+        return ((timestamp - self.epoch) << self.TIMESTAMP_SHIFT) | (self.machine_id << self.MACHINE_SHIFT) | self.sequence
+
+    def generate(self) -> int:
+        """Generate a unique snowflake ID (53-bit, JS safe)."""
+        with self._lock:
+            return self._next_id()
+
+    def generate_many(self, n: int) -> list[int]:
+        """Generate n unique snowflake IDs, acquiring the lock only once."""
+        with self._lock:
+            return [self._next_id() for _ in range(n)]
 
 
 # Global snowflake generator instance
@@ -96,3 +107,10 @@ def generate_id() -> int:
     if _snowflake is None:
         raise RuntimeError("Snowflake not initialized. Call init_snowflake() first.")
     return _snowflake.generate()
+
+
+def generate_ids(n: int) -> list[int]:
+    """Generate n unique snowflake IDs in one batch (e.g. for bulk INSERT)."""
+    if _snowflake is None:
+        raise RuntimeError("Snowflake not initialized. Call init_snowflake() first.")
+    return _snowflake.generate_many(n)
@@ -1,63 +1,142 @@
 """FastApi Telegram Bot Template Application Entry Point."""
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from app.core import close_database, close_redis, init_database, init_logger, init_redis, settings
+from app.core import close_database, close_redis, init_database, init_logger, init_redis, logger, settings
 from app.bot import bot_manager, init_bot_manager
 from app.scheduler import init_scheduler, scheduler_manager
+from app.api.telegram_router import router as telegram_router
+
+# 启动时读取一次的配置项
+_ENABLE_DOCS = settings.env != "prod"
+_APP_NAME = settings.app_name
+_DEBUG = settings.debug
+
+# /health 预先构建好的响应
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+
+
+class HealthCheckMiddleware:
+    """ASGI 中间件：直接响应 GET /health，不经过路由、依赖解析和 JSON 序列化"""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+            await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+            await send({"type": "http.response.body", "body": _HEALTH_BODY})
+            return
+        await self.app(scope, receive, send)
+
+
+async def _shutdown(*aws) -> None:
+    """并发执行一组关闭操作，单个失败不影响其他资源释放"""
+    results = await asyncio.gather(*aws, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.opt(exception=result).error("Shutdown step failed")
+
+
+async def _start_stage(stages: list[tuple], *steps: tuple) -> None:
+    """
+    并发执行一组相互独立的启动步骤
+
+    steps 为 (启动协程, 关闭函数) 元组。关闭函数先登记到 stages，
+    待本组步骤全部结束后再抛出第一个异常，避免有步骤仍在执行时就开始清理。
+    """
+    stages.append(tuple(stop for _, stop in steps))
+    results = await asyncio.gather(*(start for start, _ in steps), return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def _teardown(stages: list[tuple]) -> None:
+    """按启动顺序的逆序逐组释放资源（各关闭函数可安全用于未完全启动的资源）"""
+    for stops in reversed(stages):
+        await _shutdown(*(stop() for stop in stops))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
     init_logger()
-    await init_database()
-    await init_redis()
-
-    # 初始化并启动Bot
-    init_bot_manager()
-    await bot_manager.start()
-
-    # 初始化并启动调度器
-    init_scheduler()
-    await scheduler_manager.start()
+    stages: list[tuple] = []
+    try:
+        # 数据库与 Redis 相互独立，并发建立连接
+        await _start_stage(stages, (init_database(), close_database), (init_redis(), close_redis))
+
+        # 初始化并启动Bot和调度器
+        init_bot_manager()
+        init_scheduler()
+        await _start_stage(
+            stages,
+            (bot_manager.start(), bot_manager.stop),
+            (scheduler_manager.start(), scheduler_manager.stop),
+        )
+    except BaseException:
+        # 启动失败时释放已启动的资源再抛出
+        await _teardown(stages)
+        await logger.complete()
+        raise
+
+    # 预先生成 OpenAPI schema（结果缓存在 app.openapi_schema），避免首个文档请求卡顿
+    if app.state.enable_docs:
+        app.openapi()
 
     yield
 
-    # 停止调度器
-    await scheduler_manager.stop()
-    # 停止Bot并清理资源
-    await bot_manager.stop()
-    await close_redis()
-    await close_database()
+    # 先停止调度器和Bot，再释放 Redis 和数据库
+    await _teardown(stages)
+    # 等待后台队列中的日志写完
+    await logger.complete()
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    enable_docs = settings.env != "prod"
     app = FastAPI(
-        title=settings.app_name,
+        title=_APP_NAME,
         description="FastApi Telegram Bot Template",
         version="0.1.0",
         lifespan=lifespan,
-        docs_url="/docs" if enable_docs else None,
-        redoc_url="/redoc" if enable_docs else None,
-        openapi_url="/openapi.json" if enable_docs else None,
+        docs_url="/docs" if _ENABLE_DOCS else None,
+        redoc_url="/redoc" if _ENABLE_DOCS else None,
+        openapi_url="/openapi.json" if _ENABLE_DOCS else None,
     )
 
-    from app.api.telegram_router import router as telegram_router
+    app.state.enable_docs = _ENABLE_DOCS
     app.include_router(telegram_router)
-
-    @app.get("/health")
-    async def health_check():
-        return {"status": "ok"}
+    app.add_middleware(HealthCheckMiddleware)
 
     return app
 
 
-app = create_app()
+def __getattr__(name: str):
+    """按需创建模块级 app（供 uvicorn/gunicorn 的 main:app 使用），导入 main 时不会提前构建"""
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="localhost", port=8000, reload=settings.debug)
+    uvicorn.run(
+        "main:create_app",
+        factory=True,
+        host="localhost",
+        port=8000,
+        reload=_DEBUG,
+        # uvloop 不支持 Windows，回退到默认 asyncio 事件循环
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+    )
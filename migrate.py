@@ -3,61 +3,183 @@
 
 Usage:
     python migrate.py new "description"  # 生成迁移脚本
+    python migrate.py new "description" --empty  # 生成空迁移脚本（跳过 autogenerate）
     python migrate.py up                 # 升级到最新
     python migrate.py down               # 回滚一个版本
     python migrate.py history            # 查看迁移历史
     python migrate.py current            # 查看当前版本
     python migrate.py reset              # 清空所有表和迁移记录，重新生成迁移
+    python migrate.py reset --yes        # 跳过确认直接重置（用于脚本/CI）
 """
 
-import subprocess
+import asyncio
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from alembic.config import main as alembic_main
 
-def run(cmd: list[str]) -> None:
-    subprocess.run(cmd, check=True)
+# 单条 DROP TABLE 语句最多包含的表数（避免超过 max_allowed_packet）
+DROP_TABLE_BATCH_SIZE = 64
 
+# 各子命令共享的事件循环与数据库引擎（首次使用时创建，main 结束时释放）
+_runner: asyncio.Runner | None = None
+_engine = None
 
-def reset() -> None:
-    """清空数据库所有表、删除迁移文件、重新生成迁移。"""
-    print("⚠️  此操作将删除所有表和迁移记录！")
-    confirm = input("确认执行? (yes/no): ")
-    if confirm.lower() != "yes":
-        print("已取消")
+
+def _get_runner() -> asyncio.Runner:
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+    return _runner
+
+
+def _get_engine():
+    global _engine
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from app.core.config import settings
+
+        _engine = create_async_engine(settings.database.url, pool_pre_ping=True, pool_size=5)
+    return _engine
+
+
+def _close() -> None:
+    """释放共享的数据库引擎和事件循环。"""
+    global _runner, _engine
+    if _runner is None:
         return
+    if _engine is not None:
+        _runner.run(_engine.dispose())
+        _engine = None
+    _runner.close()
+    _runner = None
+
+
+def reset(yes: bool = False) -> None:
+    """清空数据库所有表、删除迁移文件、重新生成迁移。
+
+    Args:
+        yes: 为 True 时跳过交互确认
+    """
+    print("⚠️  此操作将删除所有表和迁移记录！")
+    if not yes:
+        confirm = input("确认执行? (yes/no): ")
+        if confirm.lower() != "yes":
+            print("已取消")
+            return
 
     # 1. 删除所有迁移文件
     versions_dir = Path(__file__).parent / "alembic" / "versions"
-    for f in versions_dir.glob("*.py"):
-        if f.name != "__init__.py":
-            f.unlink()
-            print(f"删除迁移文件: {f.name}")
+    with os.scandir(versions_dir) as it:
+        entries = [
+            entry for entry in it
+            if entry.name.endswith(".py") and entry.name != "__init__.py"
+        ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(os.unlink, (entry.path for entry in entries)))
+    for entry in entries:
+        print(f"删除迁移文件: {entry.name}")
 
     # 2. 删除数据库所有表
     print("正在清空数据库...")
-    import asyncio
-    asyncio.run(_drop_all_tables())
+    try:
+        _get_runner().run(_drop_all_tables(_get_engine()))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
     print("✅ 重置完成，请执行 python migrate.py new \"init\" 重新生成迁移")
 
 
-async def _drop_all_tables() -> None:
-    from sqlalchemy import text
-    from sqlalchemy.ext.asyncio import create_async_engine
+async def _drop_all_tables(engine) -> None:
+    """优先整库删除重建，无权删除数据库时退回逐批删除表。"""
+    if not await _recreate_database(engine):
+        await _drop_tables_in_batches(engine)
+
 
-    from app.core.config import settings
+async def _recreate_database(engine) -> bool:
+    """DROP DATABASE + CREATE DATABASE，保留原有字符集和排序规则。
+
+    Returns:
+        是否已重建；DROP 失败（如无数据库级权限）时返回 False，数据库保持不变
+
+    Raises:
+        RuntimeError: DROP 成功但 CREATE 失败，数据库已不存在
+    """
+    from sqlalchemy import URL, text
+    from sqlalchemy.exc import OperationalError
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    url = engine.url
+    database = url.database
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text(
+                "SELECT default_character_set_name, default_collation_name "
+                "FROM information_schema.schemata WHERE schema_name = DATABASE()"
+            )
+        )
+        charset, collation = result.one()
+
+    # 不指定数据库连接到服务器（URL.set(database=None) 不会清除库名，需重新构建 URL）
+    server_url = URL.create(
+        url.drivername,
+        username=url.username,
+        password=url.password,
+        host=url.host,
+        port=url.port,
+        query=url.query,
+    )
+    server_engine = create_async_engine(server_url, poolclass=NullPool)
+    try:
+        async with server_engine.begin() as conn:
+            try:
+                await conn.execute(text(f"DROP DATABASE IF EXISTS `{database}`"))
+            except OperationalError as e:
+                print(f"  删除数据库失败（{e.orig}），改为逐批删除表")
+                return False
+            try:
+                await conn.execute(
+                    text(f"CREATE DATABASE `{database}` CHARACTER SET {charset} COLLATE {collation}")
+                )
+            except OperationalError as e:
+                raise RuntimeError(
+                    f"数据库 `{database}` 已删除但重建失败（{e.orig}），"
+                    f"请手动执行: CREATE DATABASE `{database}` CHARACTER SET {charset} COLLATE {collation}"
+                ) from e
+    finally:
+        await server_engine.dispose()
+    print(f"  重建数据库: {database}")
+    return True
+
+
+async def _drop_tables_in_batches(engine) -> None:
+    from sqlalchemy import text
 
-    engine = create_async_engine(settings.database.url)
     async with engine.begin() as conn:
         await conn.execute(text("SET FOREIGN_KEY_CHECKS = 0"))
-        result = await conn.execute(text("SHOW TABLES"))
-        tables = [row[0] for row in result.fetchall()]
-        for table in tables:
-            await conn.execute(text(f"DROP TABLE IF EXISTS `{table}`"))
-            print(f"  删除表: {table}")
+        # 由数据库直接生成每批待删除的表名列表（每行一批，已加反引号）
+        await conn.execute(text("SET SESSION group_concat_max_len = 1048576"))
+        result = await conn.execute(
+            text(
+                "SELECT GROUP_CONCAT(CONCAT('`', table_name, '`') SEPARATOR ', ') "
+                "FROM (SELECT table_name, "
+                "(ROW_NUMBER() OVER (ORDER BY table_name) - 1) DIV :batch_size AS batch "
+                "FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_type = 'BASE TABLE') AS t "
+                "GROUP BY batch"
+            ),
+            {"batch_size": DROP_TABLE_BATCH_SIZE},
+        )
+        # 多表合并为一条 DROP 语句，减少网络往返
+        for (names,) in result.all():
+            print(f"  删除表: {names}")
+            await conn.execute(text(f"DROP TABLE IF EXISTS {names}"))
         await conn.execute(text("SET FOREIGN_KEY_CHECKS = 1"))
-    await engine.dispose()
 
 
 def main() -> None:
@@ -67,28 +189,36 @@ def main() -> None:
 
     cmd = sys.argv[1]
 
-    match cmd:
-        case "new":
-            if len(sys.argv) < 3:
-                print("Usage: python migrate.py new \"description\"")
+    try:
+        match cmd:
+            case "new":
+                args = [arg for arg in sys.argv[2:] if arg != "--empty"]
+                if not args:
+                    print("Usage: python migrate.py new \"description\" [--empty]")
+                    sys.exit(1)
+                # --empty 跳过 autogenerate，不反射数据库做结构对比
+                if "--empty" in sys.argv[2:]:
+                    alembic_main(argv=["revision", "-m", args[0]])
+                else:
+                    alembic_main(argv=["revision", "--autogenerate", "-m", args[0]])
+            case "up":
+                target = sys.argv[2] if len(sys.argv) > 2 else "head"
+                alembic_main(argv=["upgrade", target])
+            case "down":
+                target = sys.argv[2] if len(sys.argv) > 2 else "-1"
+                alembic_main(argv=["downgrade", target])
+            case "history":
+                alembic_main(argv=["history", "--verbose"])
+            case "current":
+                alembic_main(argv=["current"])
+            case "reset":
+                reset(yes=bool({"--yes", "-y"} & set(sys.argv[2:])))
+            case _:
+                print(f"Unknown command: {cmd}")
+                print(__doc__)
                 sys.exit(1)
-            run(["alembic", "revision", "--autogenerate", "-m", sys.argv[2]])
-        case "up":
-            target = sys.argv[2] if len(sys.argv) > 2 else "head"
-            run(["alembic", "upgrade", target])
-        case "down":
-            target = sys.argv[2] if len(sys.argv) > 2 else "-1"
-            run(["alembic", "downgrade", target])
-        case "history":
-            run(["alembic", "history", "--verbose"])
-        case "current":
-            run(["alembic", "current"])
-        case "reset":
-            reset()
-        case _:
-            print(f"Unknown command: {cmd}")
-            print(__doc__)
-            sys.exit(1)
+    finally:
+        _close()
 
 
 if __name__ == "__main__":
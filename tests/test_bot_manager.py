@@ -0,0 +1,116 @@
+"""BotInstance webhook 更新队列测试。"""
+
+import asyncio
+import importlib
+
+import pytest
+
+from app.bot.bot_manager import MAX_PENDING_UPDATES, BotInstance, BotMode
+
+# app.bot 包导出的 bot_manager 实例遮蔽了同名模块，需通过 importlib 获取模块本身
+bot_manager_module = importlib.import_module("app.bot.bot_manager")
+
+
+def _make_instance() -> BotInstance:
+    return BotInstance(name="test", token="123456:TEST-token", mode=BotMode.WEBHOOK)
+
+
+class _FakeSession:
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def instance(monkeypatch):
+    bot = _make_instance()
+    monkeypatch.setattr(bot.bot, "session", _FakeSession())
+    return bot
+
+
+def _start_consumer(instance: BotInstance) -> None:
+    instance._consumer_task = asyncio.create_task(instance._consume_updates())
+
+
+async def test_submit_update_is_processed(instance, monkeypatch):
+    processed: list[bytes] = []
+
+    async def feed_update(raw: bytes) -> None:
+        processed.append(raw)
+
+    monkeypatch.setattr(instance, "feed_update", feed_update)
+    _start_consumer(instance)
+
+    assert instance.submit_update(b"1") is True
+    await asyncio.wait_for(instance._update_queue.join(), 1)
+
+    assert processed == [b"1"]
+    await instance.stop()
+
+
+async def test_submit_update_drops_when_queue_full(instance):
+    for i in range(MAX_PENDING_UPDATES):
+        assert instance.submit_update(str(i).encode()) is True
+
+    assert instance.submit_update(b"overflow") is False
+    assert instance.dropped_updates == 1
+
+
+async def test_slow_update_does_not_block_others(instance, monkeypatch):
+    slow_started = asyncio.Event()
+    release_slow = asyncio.Event()
+    fast_done = asyncio.Event()
+    processed: list[bytes] = []
+
+    async def feed_update(raw: bytes) -> None:
+        if raw == b"slow":
+            slow_started.set()
+            await release_slow.wait()
+        processed.append(raw)
+        if len(processed) == 5:
+            fast_done.set()
+
+    monkeypatch.setattr(instance, "feed_update", feed_update)
+    _start_consumer(instance)
+
+    instance.submit_update(b"slow")
+    await asyncio.wait_for(slow_started.wait(), 1)
+    for i in range(5):
+        instance.submit_update(str(i).encode())
+    await asyncio.wait_for(fast_done.wait(), 1)
+
+    assert processed == [b"0", b"1", b"2", b"3", b"4"]
+    release_slow.set()
+    await instance.stop()
+    assert processed[-1] == b"slow"
+
+
+async def test_stop_drains_pending_updates(instance, monkeypatch):
+    processed: list[bytes] = []
+
+    async def feed_update(raw: bytes) -> None:
+        await asyncio.sleep(0.01)
+        processed.append(raw)
+
+    monkeypatch.setattr(instance, "feed_update", feed_update)
+    _start_consumer(instance)
+
+    for i in range(10):
+        instance.submit_update(str(i).encode())
+    await instance.stop()
+
+    assert len(processed) == 10
+    assert instance._consumer_task is None
+
+
+async def test_stop_gives_up_on_hanging_update(instance, monkeypatch):
+    async def feed_update(raw: bytes) -> None:
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(instance, "feed_update", feed_update)
+    monkeypatch.setattr(bot_manager_module, "UPDATE_DRAIN_TIMEOUT", 0.05)
+    _start_consumer(instance)
+
+    instance.submit_update(b"hang")
+    await asyncio.wait_for(instance.stop(), 1)
+
+    assert instance._consumer_task is None
@@ -0,0 +1,16 @@
+"""日志工具测试。"""
+
+from loguru import logger
+
+from app.core.logger import get_module_logger
+
+
+def test_module_logger_formats_plain_arguments():
+    messages: list[str] = []
+    handler_id = logger.add(messages.append, format="{extra[module]} {message}")
+    try:
+        get_module_logger("payment").info("amount {}", 5)
+    finally:
+        logger.remove(handler_id)
+
+    assert messages == ["payment amount 5\n"]
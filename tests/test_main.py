@@ -0,0 +1,35 @@
+"""应用启动/关闭流程测试。"""
+
+import pytest
+
+from main import _start_stage, _teardown
+
+
+async def test_failed_startup_stage_tears_down_started_steps():
+    calls: list[str] = []
+
+    async def start(name: str) -> None:
+        calls.append(f"start {name}")
+
+    async def fail() -> None:
+        raise RuntimeError("redis down")
+
+    def stop(name: str):
+        async def _stop() -> None:
+            calls.append(f"stop {name}")
+
+        return _stop
+
+    stages: list[tuple] = []
+    await _start_stage(stages, (start("db"), stop("db")))
+    with pytest.raises(RuntimeError, match="redis down"):
+        await _start_stage(stages, (start("bot"), stop("bot")), (fail(), stop("scheduler")))
+    await _teardown(stages)
+
+    assert calls == [
+        "start db",
+        "start bot",
+        "stop bot",
+        "stop scheduler",
+        "stop db",
+    ]